@@ -1,9 +1,15 @@
 """Dedaub-inspired heuristics for analyzing Solidity smart contracts."""
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+from collections import Counter
+from dataclasses import dataclass
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, TypedDict
+
+try:  # optional multi-keyword matcher
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
 
 RISK_THRESHOLDS = {
     "low": (0, 39),
@@ -11,17 +17,61 @@ RISK_THRESHOLDS = {
     "high": (70, 1000),
 }
 
+# Detectors with regex metacharacters share a single pass over the source;
+# ``match.lastgroup`` identifies which detector fired.
+_COMBINED = re.compile(
+    r"(?P<delegatecall>\.delegatecall\s*\()"
+    r"|(?P<callvalue>\.call\s*\((?=.*value))"
+    r"|(?P<timestamp>block\.timestamp|block\.number|\bnow\b)"
+    r"|(?P<assembly>assembly\s*\{)"
+    r"|(?P<unchecked>unchecked\s*\{)"
+    r"|(?P<func>function\s+)"
+    r"|(?P<event>event\s+)"
+    r"|(?P<modifier>modifier\s+)",
+    re.IGNORECASE,
+)
+
+_RE_PRAGMA_08 = re.compile(r"pragma\s+solidity\s+(\^|>=)\s*0\.8")
+
+# Plain keywords are counted with ``str.count`` against the lowercased source.
+_LITERAL_NEEDLES = {
+    "callbrace": ("call{value",),
+    "selfdestruct": ("selfdestruct", "suicide"),
+    "tx_origin": ("tx.origin",),
+    "priv": ("onlyowner", "onlyrole", "ownable"),
+    "pause": ("whennotpaused", "whenpaused"),
+    "nonreentrant": ("nonreentrant",),
+}
+
+
+def _build_automaton() -> Any:
+    """Compile all literal needles into one Aho-Corasick automaton, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for group, needles in _LITERAL_NEEDLES.items():
+        for needle in needles:
+            automaton.add_word(needle, group)
+    automaton.make_automaton()
+    return automaton
+
+
+# None of the needles overlap, so automaton hits equal the ``str.count`` totals.
+_AUTOMATON = _build_automaton()
+
+
+class Finding(TypedDict):
+    """Represents a single detector result in the final report.
 
-@dataclass
-class Finding:
-    """Represents a single detector result in the final report."""
+    Findings are plain dicts so they can be placed in the report as-is.
+    """
 
     id: str
     title: str
     severity: str
     description: str
-    evidence: List[str] = field(default_factory=list)
-    remediation: str | None = None
+    evidence: List[str]
+    remediation: str | None
 
 
 def _classify_risk(score: int) -> Dict[str, Any]:
@@ -31,8 +81,135 @@ def _classify_risk(score: int) -> Dict[str, Any]:
     return {"label": "critical", "score": score}
 
 
-def _count(pattern: str, source: str) -> int:
-    return len(re.findall(pattern, source, flags=re.IGNORECASE | re.MULTILINE))
+@dataclass(frozen=True)
+class DetectorSpec:
+    """Static description of a detector: where its hits come from and how it scores."""
+
+    id: str
+    groups: Tuple[str, ...]
+    metric: str
+    title: str
+    severity: str
+    description: str
+    evidence: str
+    remediation: str
+    base: int
+    step: int
+    cap: int
+
+    def hits(self, counts: Counter[str]) -> int:
+        return sum(counts[group] for group in self.groups)
+
+    def finding(self, hits: int) -> Finding:
+        return Finding(
+            id=self.id,
+            title=self.title,
+            severity=self.severity,
+            description=self.description,
+            evidence=[self.evidence.format(hits=hits)],
+            remediation=self.remediation,
+        )
+
+    def bump(self, hits: int) -> int:
+        """Score ``base`` plus ``step`` per extra hit, with the extra capped at ``cap``."""
+        extra = self.step * (hits - 1)
+        return self.base + (extra if extra < self.cap else self.cap)
+
+
+# Ordered by priority: the first detector that fires headlines the summary.
+DETECTORS: List[DetectorSpec] = [
+    DetectorSpec(
+        id="delegatecall",
+        groups=("delegatecall",),
+        metric="delegatecall_count",
+        title="Delegatecall usage",
+        severity="high",
+        description="Contract executes code in the context of another contract, which can fully control storage.",
+        evidence="{hits} delegatecall invocation(s) detected",
+        remediation="Confirm the target is trusted and immutable, or restrict inputs via allow-lists.",
+        base=45,
+        step=10,
+        cap=20,
+    ),
+    DetectorSpec(
+        id="low_level_call_value",
+        groups=("callvalue", "callbrace"),
+        metric="low_level_call_with_value",
+        title="Low-level call with value",
+        severity="medium",
+        description="Value transfer via low-level call observed. External call ordering must follow checks-effects-interactions to avoid reentrancy.",
+        evidence="{hits} low-level call(s) moving value",
+        remediation="Add reentrancy guards and ensure state updates happen before external calls.",
+        base=18,
+        step=6,
+        cap=12,
+    ),
+    DetectorSpec(
+        id="timestamp_dependence",
+        groups=("timestamp",),
+        metric="timestamp_dependency",
+        title="Timestamp or block number dependence",
+        severity="medium",
+        description="Contract relies on miner-influenced values for logic or randomness.",
+        evidence="{hits} reference(s) to block timestamp/number",
+        remediation="Avoid using timestamps for critical logic or mix with entropy from multiple sources.",
+        base=8,
+        step=4,
+        cap=8,
+    ),
+    DetectorSpec(
+        id="selfdestruct",
+        groups=("selfdestruct",),
+        metric="selfdestruct_count",
+        title="Self-destruct capability",
+        severity="high",
+        description="Self-destruct allows the contract to delete itself and send funds to a receiver.",
+        evidence="{hits} selfdestruct clause(s)",
+        remediation="Protect self-destruct with strict access controls and document kill-switch procedures.",
+        base=35,
+        step=10,
+        cap=20,
+    ),
+    DetectorSpec(
+        id="inline_assembly",
+        groups=("assembly",),
+        metric="assembly_blocks",
+        title="Inline assembly present",
+        severity="medium",
+        description="Inline assembly bypasses many compiler checks and complicates audits.",
+        evidence="{hits} assembly block(s)",
+        remediation="Consider rewriting logic in Solidity or include thorough assembly documentation.",
+        base=12,
+        step=4,
+        cap=8,
+    ),
+    DetectorSpec(
+        id="tx_origin_auth",
+        groups=("tx_origin",),
+        metric="tx_origin_references",
+        title="tx.origin authentication",
+        severity="high",
+        description="Using tx.origin for access control exposes the contract to phishing vectors.",
+        evidence="{hits} tx.origin reference(s)",
+        remediation="Replace tx.origin checks with msg.sender and, ideally, role-based access controls.",
+        base=30,
+        step=10,
+        cap=20,
+    ),
+    DetectorSpec(
+        id="unchecked_blocks",
+        groups=("unchecked",),
+        metric="unchecked_blocks",
+        title="Unchecked arithmetic blocks",
+        severity="low",
+        description="Unchecked blocks skip Solidity's automatic overflow checks introduced in 0.8.x.",
+        evidence="{hits} unchecked block(s)",
+        remediation="Ensure every unchecked block is justified and covered by tests.",
+        base=6,
+        step=3,
+        cap=6,
+    ),
+]
 
 
 def _normalize_source(source: str) -> str:
@@ -46,120 +223,38 @@ def analyze_contract(address: str, source: str, metadata: Dict[str, Any] | None
     source = _normalize_source(source)
     findings: List[Finding] = []
     risk_score = 5  # baseline risk for unaudited code
+    counts: Counter[str] = Counter()
+    if source:
+        counts.update(match.lastgroup for match in _COMBINED.finditer(source))
+        source_lower = source.lower()
+        if _AUTOMATON is not None:
+            counts.update(group for _, group in _AUTOMATON.iter(source_lower))
+        else:
+            for group, needles in _LITERAL_NEEDLES.items():
+                counts[group] = sum(source_lower.count(needle) for needle in needles)
 
-    delegatecall_hits = _count(r"\.delegatecall\s*\(", source)
-    if delegatecall_hits:
-        findings.append(
-            Finding(
-                id="delegatecall",
-                title="Delegatecall usage",
-                severity="high",
-                description="Contract executes code in the context of another contract, which can fully control storage.",
-                evidence=[f"{delegatecall_hits} delegatecall invocation(s) detected"],
-                remediation="Confirm the target is trusted and immutable, or restrict inputs via allow-lists.",
-            )
-        )
-        risk_score += 45 + min(10 * (delegatecall_hits - 1), 20)
-
-    callvalue_hits = _count(r"\.call\s*\(.*value", source)
-    call_with_value_hits = _count(r"call\{value", source)
-    total_call_risk = callvalue_hits + call_with_value_hits
-    if total_call_risk:
-        findings.append(
-            Finding(
-                id="low_level_call_value",
-                title="Low-level call with value",
-                severity="medium",
-                description="Value transfer via low-level call observed. External call ordering must follow checks-effects-interactions to avoid reentrancy.",
-                evidence=[f"{total_call_risk} low-level call(s) moving value"],
-                remediation="Add reentrancy guards and ensure state updates happen before external calls.",
-            )
-        )
-        risk_score += 18 + min(6 * (total_call_risk - 1), 12)
-
-    timestamp_hits = _count(r"block\.timestamp|block\.number|now", source)
-    if timestamp_hits:
-        findings.append(
-            Finding(
-                id="timestamp_dependence",
-                title="Timestamp or block number dependence",
-                severity="medium",
-                description="Contract relies on miner-influenced values for logic or randomness.",
-                evidence=[f"{timestamp_hits} reference(s) to block timestamp/number"],
-                remediation="Avoid using timestamps for critical logic or mix with entropy from multiple sources.",
-            )
-        )
-        risk_score += 8 + min(4 * (timestamp_hits - 1), 8)
-
-    selfdestruct_hits = _count(r"selfdestruct|suicide", source)
-    if selfdestruct_hits:
-        findings.append(
-            Finding(
-                id="selfdestruct",
-                title="Self-destruct capability",
-                severity="high",
-                description="Self-destruct allows the contract to delete itself and send funds to a receiver.",
-                evidence=[f"{selfdestruct_hits} selfdestruct clause(s)"],
-                remediation="Protect self-destruct with strict access controls and document kill-switch procedures.",
-            )
-        )
-        risk_score += 35 + min(10 * (selfdestruct_hits - 1), 20)
-
-    assembly_hits = _count(r"assembly\s*\{", source)
-    if assembly_hits:
-        findings.append(
-            Finding(
-                id="inline_assembly",
-                title="Inline assembly present",
-                severity="medium",
-                description="Inline assembly bypasses many compiler checks and complicates audits.",
-                evidence=[f"{assembly_hits} assembly block(s)"],
-                remediation="Consider rewriting logic in Solidity or include thorough assembly documentation.",
-            )
-        )
-        risk_score += 12 + min(4 * (assembly_hits - 1), 8)
-
-    tx_origin_hits = _count(r"tx\.origin", source)
-    if tx_origin_hits:
-        findings.append(
-            Finding(
-                id="tx_origin_auth",
-                title="tx.origin authentication",
-                severity="high",
-                description="Using tx.origin for access control exposes the contract to phishing vectors.",
-                evidence=[f"{tx_origin_hits} tx.origin reference(s)"],
-                remediation="Replace tx.origin checks with msg.sender and, ideally, role-based access controls.",
-            )
-        )
-        risk_score += 30 + min(10 * (tx_origin_hits - 1), 20)
-
-    unchecked_hits = _count(r"unchecked\s*\{", source)
-    if unchecked_hits:
-        findings.append(
-            Finding(
-                id="unchecked_blocks",
-                title="Unchecked arithmetic blocks",
-                severity="low",
-                description="Unchecked blocks skip Solidity's automatic overflow checks introduced in 0.8.x.",
-                evidence=[f"{unchecked_hits} unchecked block(s)"],
-                remediation="Ensure every unchecked block is justified and covered by tests.",
-            )
-        )
-        risk_score += 6 + min(3 * (unchecked_hits - 1), 6)
-
-    privileged_patterns = _count(r"onlyOwner|onlyRole|Ownable", source)
-    owner_modifiers = privileged_patterns > 0
-
-    pause_patterns = _count(r"whenNotPaused|whenPaused", source)
-    pausable = pause_patterns > 0
-
-    non_reentrant = bool(re.search(r"nonReentrant", source, flags=re.IGNORECASE))
+    stats = {
+        "function_count": counts["func"],
+        "event_count": counts["event"],
+        "modifier_count": counts["modifier"],
+    }
+    for spec in DETECTORS:
+        hits = spec.hits(counts)
+        stats[spec.metric] = hits
+        if hits:
+            findings.append(spec.finding(hits))
+            risk_score += spec.bump(hits)
+    total_call_risk = stats["low_level_call_with_value"]
+
+    owner_modifiers = counts["priv"] > 0
+    pausable = counts["pause"] > 0
+    non_reentrant = counts["nonreentrant"] > 0
 
     summary_parts: List[str] = []
     if findings:
         top_finding = findings[0]
         summary_parts.append(
-            f"Detected {len(findings)} risk factor(s); most prominent: {top_finding.title}."
+            f"Detected {len(findings)} risk factor(s); most prominent: {top_finding['title']}."
         )
     else:
         summary_parts.append("No critical patterns detected by heuristics.")
@@ -174,24 +269,11 @@ def analyze_contract(address: str, source: str, metadata: Dict[str, Any] | None
 
     summary = " ".join(summary_parts)
 
-    stats = {
-        "function_count": _count(r"function\s+", source),
-        "event_count": _count(r"event\s+", source),
-        "modifier_count": _count(r"modifier\s+", source),
-        "delegatecall_count": delegatecall_hits,
-        "low_level_call_with_value": total_call_risk,
-        "selfdestruct_count": selfdestruct_hits,
-        "assembly_blocks": assembly_hits,
-        "timestamp_dependency": timestamp_hits,
-        "tx_origin_references": tx_origin_hits,
-        "unchecked_blocks": unchecked_hits,
-    }
-
     heuristics = {
         "has_owner_modifiers": owner_modifiers,
         "has_pause_mechanism": pausable,
         "uses_non_reentrant_guard": non_reentrant,
-        "uses_solidity_08_checks": "pragma solidity ^0.8" in source or "pragma solidity >=0.8" in source,
+        "uses_solidity_08_checks": bool(_RE_PRAGMA_08.search(source)),
     }
 
     review_steps: List[str] = [
@@ -206,8 +288,8 @@ def analyze_contract(address: str, source: str, metadata: Dict[str, Any] | None
 
     recommendations: List[str] = []
     for finding in findings:
-        if finding.remediation:
-            recommendations.append(finding.remediation)
+        if finding["remediation"]:
+            recommendations.append(finding["remediation"])
     if not findings:
         recommendations.append("Maintain rigorous monitoring and consider an external audit despite clean heuristics.")
 
@@ -215,7 +297,7 @@ def analyze_contract(address: str, source: str, metadata: Dict[str, Any] | None
         "address": address,
         "summary": summary,
         "risk_rating": risk,
-        "findings": [asdict(finding) for finding in findings],
+        "findings": findings,
         "metrics": stats,
         "heuristics": heuristics,
         "analysis_steps": review_steps,
@@ -2,14 +2,34 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
 from typing import Callable, Iterable
 from wsgiref.simple_server import make_server
 
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 from .analysis import analyze_contract
 from .data import ANALYZER_FEATURES, CHECKLIST, SAMPLE_ANALYSIS_PAYLOAD
 
 TEMPLATE_PATH = Path(__file__).with_name("templates").joinpath("index.html")
+MAX_SOURCE_BYTES = 2 * 1024 * 1024
+REPORT_CACHE_SIZE = 256
+# Re-render the landing page on every request so template edits show up live.
+DEV_MODE = os.environ.get("AUDIT_APP_DEV") == "1"
+
+_REPORT_CACHE: OrderedDict[bytes, bytes] = OrderedDict()
+_REPORT_CACHE_LOCK = threading.Lock()
+
+
+class PayloadTooLarge(ValueError):
+    """Raised when a request body exceeds :data:`MAX_SOURCE_BYTES`."""
 
 
 def render_index() -> str:
@@ -36,6 +56,46 @@ def render_index() -> str:
     )
 
 
+def _dumps(payload: object) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON, preferring ``orjson`` when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:  # e.g. integers beyond 64 bits or lone surrogates
+            pass
+    return json.dumps(payload).encode("utf-8")
+
+
+def _report_key(address: str, source: str, metadata: dict) -> bytes:
+    """Hash the analyzer inputs into a fixed-size cache key."""
+    hasher = blake2b(digest_size=16)
+    for part in (address, source, json.dumps(metadata, sort_keys=True)):
+        data = part.encode("utf-8", "surrogatepass")
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+    return hasher.digest()
+
+
+def _cached_report(address: str, source: str, metadata: dict) -> bytes:
+    """Return the encoded report for the inputs, analysing on a cache miss."""
+    key = _report_key(address, source, metadata)
+    with _REPORT_CACHE_LOCK:
+        body = _REPORT_CACHE.get(key)
+        if body is not None:
+            _REPORT_CACHE.move_to_end(key)
+            return body
+    body = _dumps(analyze_contract(address=address, source=source, metadata=metadata))
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE[key] = body
+        while len(_REPORT_CACHE) > REPORT_CACHE_SIZE:
+            _REPORT_CACHE.popitem(last=False)
+    return body
+
+
+_INDEX_HTML = render_index().encode("utf-8")
+_CHECKLIST_JSON = json.dumps({"sections": CHECKLIST}).encode("utf-8")
+
+
 def _response(
     start_response: Callable[..., None],
     status: str,
@@ -53,27 +113,26 @@ def _response(
     return [body]
 
 
-def _read_json_body(environ: dict) -> tuple[dict, list[bytes]]:
-    """Read a JSON request body, returning the payload and raw fragments."""
-    raw_chunks: list[bytes] = []
+def _read_json_body(environ: dict) -> dict:
+    """Read and decode a JSON object from the request body."""
     try:
         length = int(environ.get("CONTENT_LENGTH") or 0)
     except (TypeError, ValueError):
         length = 0
     if length < 0:
         length = 0
+    if length > MAX_SOURCE_BYTES:
+        raise PayloadTooLarge(f"Request body exceeds {MAX_SOURCE_BYTES} bytes")
     body_bytes = environ["wsgi.input"].read(length)
-    raw_chunks.append(body_bytes)
-    text = body_bytes.decode("utf-8") if body_bytes else ""
-    if not text:
-        return {}, raw_chunks
+    if not body_bytes:
+        return {}
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
+        payload = json.loads(body_bytes)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError(f"Invalid JSON payload: {exc}") from exc
     if not isinstance(payload, dict):
         raise ValueError("JSON payload must be an object")
-    return payload, raw_chunks
+    return payload
 
 
 def create_app() -> Callable[[dict, Callable[..., None]], Iterable[bytes]]:
@@ -83,15 +142,14 @@ def create_app() -> Callable[[dict, Callable[..., None]], Iterable[bytes]]:
         path = environ.get("PATH_INFO", "/")
         method = environ.get("REQUEST_METHOD", "GET").upper()
         if path in {"", "/"} and method == "GET":
-            body = render_index().encode("utf-8")
+            body = render_index().encode("utf-8") if DEV_MODE else _INDEX_HTML
             return _response(start_response, "200 OK", body, "text/html; charset=utf-8")
 
         if path == "/api/checklist" and method == "GET":
-            payload = json.dumps({"sections": CHECKLIST}).encode("utf-8")
             return _response(
                 start_response,
                 "200 OK",
-                payload,
+                _CHECKLIST_JSON,
                 "application/json; charset=utf-8",
             )
 
@@ -105,7 +163,14 @@ def create_app() -> Callable[[dict, Callable[..., None]], Iterable[bytes]]:
                     extra_headers=[("Allow", "POST")],
                 )
             try:
-                payload, _ = _read_json_body(environ)
+                payload = _read_json_body(environ)
+            except PayloadTooLarge as exc:
+                return _response(
+                    start_response,
+                    "413 Payload Too Large",
+                    str(exc).encode("utf-8"),
+                    "text/plain; charset=utf-8",
+                )
             except ValueError as exc:
                 return _response(
                     start_response,
@@ -137,8 +202,7 @@ def create_app() -> Callable[[dict, Callable[..., None]], Iterable[bytes]]:
                     b"'metadata' must be an object when provided",
                     "text/plain; charset=utf-8",
                 )
-            report = analyze_contract(address=address, source=source, metadata=metadata or {})
-            payload = json.dumps(report).encode("utf-8")
+            payload = _cached_report(address, source, metadata or {})
             return _response(
                 start_response,
                 "200 OK",
@@ -152,9 +216,13 @@ def create_app() -> Callable[[dict, Callable[..., None]], Iterable[bytes]]:
     return application
 
 
+# Shared WSGI callable; mount as ``audit_app.app:app``.
+app = create_app()
+
+
 def run(host: str = "127.0.0.1", port: int = 8000) -> None:
     """Run the development server."""
-    with make_server(host, port, create_app()) as httpd:
+    with make_server(host, port, app) as httpd:
         print(f"Serving on http://{host}:{port}")
         httpd.serve_forever()
 
@@ -1,6 +1,11 @@
 import hashlib
 import hmac
 
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python byte loop
+    np = None
+
 # GF256 arithmetic functions
 def _gf256_add(a, b):
     return a ^ b
@@ -8,59 +13,73 @@ def _gf256_add(a, b):
 def _gf256_sub(a, b):
     return a ^ b
 
+# Log/antilog tables over the generator 3 (AES polynomial 0x11b)
+def _build_gf256_tables():
+    exp = [0] * 512
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        x ^= (x << 1) ^ (0x11b if x & 0x80 else 0)
+        x &= 0xff
+    for i in range(255, 512):
+        exp[i] = exp[i - 255]
+    return exp, log
+
+GF_EXP, GF_LOG = _build_gf256_tables()
+
+if np is not None:
+    GF_EXP_NP = np.array(GF_EXP, dtype=np.uint8)
+    GF_LOG_NP = np.array(GF_LOG, dtype=np.int16)
+
 def _gf256_mul(a, b):
-    p = 0
-    a = a & 0xff
-    b = b & 0xff
-    for _ in range(8):
-        if b & 1:
-            p ^= a
-        carry = a & 0x80
-        a <<= 1
-        if carry:
-            a ^= 0x11b
-        b >>= 1
-    return p & 0xff
+    a &= 0xff
+    b &= 0xff
+    if a == 0 or b == 0:
+        return 0
+    return GF_EXP[GF_LOG[a] + GF_LOG[b]]
 
 def _gf256_inverse(a):
+    a &= 0xff
     if a == 0:
         return 0
-    for b in range(1, 256):
-        if _gf256_mul(a, b) == 1:
-            return b
-    return 0
+    return GF_EXP[255 - GF_LOG[a]]
 
 # BIP39 functions
 def load_wordlist(filename):
+    """Return the words as an immutable tuple plus a word -> index dict.
+
+    The tuple cannot be edited in place, so the index never goes stale.
+    """
     with open(filename, 'r') as f:
-        return [line.strip() for line in f.readlines()]
+        word_list = tuple(line.strip() for line in f.readlines())
+    word_index = {}
+    for idx, word in enumerate(word_list):
+        word_index.setdefault(word, idx)  # first occurrence wins, like list.index
+    return word_list, word_index
 
-def mnemonic_to_bytes(mnemonic, word_list):
+def mnemonic_to_bytes(mnemonic, word_index):
     words = mnemonic.split()
     if len(words) != 12:
         raise ValueError("Mnemonic must have 12 words")
-    indices = [word_list.index(word) for word in words]
-    bit_string = ''.join([bin(idx)[2:].zfill(11) for idx in indices])
-    if len(bit_string) != 132:
-        raise ValueError("Bit string length error")
-    entropy_bits = bit_string[:128]
-    entropy_bytes = bytes(int(entropy_bits[i:i+8], 2) for i in range(0, 128, 8))
-    return entropy_bytes
+    try:
+        indices = [word_index[word] for word in words]
+    except KeyError as exc:
+        raise ValueError(f"Unknown mnemonic word: {exc.args[0]}") from None
+    acc = 0
+    for idx in indices:
+        acc = (acc << 11) | idx
+    entropy_int = acc >> 4  # drop the 4 checksum bits
+    return entropy_int.to_bytes(16, 'big')
 
 def bytes_to_mnemonic(entropy_bytes, word_list):
     if len(entropy_bytes) != 16:
         raise ValueError("Entropy must be 16 bytes")
-    entropy_bits = ''.join([bin(b)[2:].zfill(8) for b in entropy_bytes])
     hash_bytes = hashlib.sha256(entropy_bytes).digest()
-    hash_bits = bin(hash_bytes[0])[2:].zfill(8)
-    checksum = hash_bits[:4]
-    total_bits = entropy_bits + checksum
-    if len(total_bits) != 132:
-        raise ValueError("Total bits should be 132")
-    words = []
-    for i in range(0, 132, 11):
-        idx = int(total_bits[i:i+11], 2)
-        words.append(word_list[idx])
+    checksum = hash_bytes[0] >> 4
+    acc = (int.from_bytes(entropy_bytes, 'big') << 4) | checksum
+    words = [word_list[(acc >> (11 * (11 - i))) & 0x7FF] for i in range(12)]
     return ' '.join(words)
 
 def mnemonic_to_seed(mnemonic, passphrase=""):
@@ -69,29 +88,40 @@ def mnemonic_to_seed(mnemonic, passphrase=""):
     seed = hashlib.pbkdf2_hmac('sha512', mnemonic_bytes, salt, 2048)
     return seed.hex()
 
+# Shamir recovery from the shares at x=1 and x=2 of a degree-1 polynomial
+def recover_secret(share1_bytes, share2_bytes):
+    if len(share1_bytes) != len(share2_bytes):
+        raise ValueError("Shares must have the same length")
+    inv_3 = _gf256_inverse(3)  # Inverse of 3 in GF(256)
+    if np is not None:
+        s1 = np.frombuffer(share1_bytes, dtype=np.uint8)
+        s2 = np.frombuffer(share2_bytes, dtype=np.uint8)
+        xor = s1 ^ s2
+        mask = xor != 0
+        b = np.zeros(len(s1), dtype=np.uint8)
+        b[mask] = GF_EXP_NP[GF_LOG_NP[xor[mask]] + GF_LOG[inv_3]]
+        return bytes(s1 ^ b)
+
+    log_inv_3 = GF_LOG[inv_3]
+    secret_bytes = bytearray(len(share1_bytes))
+    for i in range(len(share1_bytes)):
+        y1 = share1_bytes[i]
+        diff = y1 ^ share2_bytes[i]
+        b_i = GF_EXP[GF_LOG[diff] + log_inv_3] if diff else 0
+        secret_bytes[i] = y1 ^ b_i  # a_i is the secret byte
+    return bytes(secret_bytes)
+
 # Main code to recover seed from two shares
 def main():
-    word_list = load_wordlist("english.txt")  # Ensure english.txt is in the same directory
+    word_list, word_index = load_wordlist("english.txt")  # Ensure english.txt is in the same directory
     
     share1_mnemonic = "session cigar grape merry useful churn fatal thought very any arm unaware"
     share2_mnemonic = "clock fresh security field caution effort gorilla speed plastic common tomato echo"
     
-    share1_bytes = mnemonic_to_bytes(share1_mnemonic, word_list)
-    share2_bytes = mnemonic_to_bytes(share2_mnemonic, word_list)
-    
-    x1 = 1
-    x2 = 2
-    inv_3 = _gf256_inverse(3)  # Inverse of 3 in GF(256)
-    
-    secret_bytes = bytearray()
-    for i in range(len(share1_bytes)):
-        y1 = share1_bytes[i]
-        y2 = share2_bytes[i]
-        b_i = _gf256_mul(_gf256_add(y1, y2), inv_3)
-        a_i = _gf256_add(y1, b_i)  # a_i is the secret byte
-        secret_bytes.append(a_i)
+    share1_bytes = mnemonic_to_bytes(share1_mnemonic, word_index)
+    share2_bytes = mnemonic_to_bytes(share2_mnemonic, word_index)
     
-    secret_bytes = bytes(secret_bytes)
+    secret_bytes = recover_secret(share1_bytes, share2_bytes)
     original_mnemonic = bytes_to_mnemonic(secret_bytes, word_list)
     seed = mnemonic_to_seed(original_mnemonic)
     
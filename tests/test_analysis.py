@@ -1,6 +1,9 @@
 """Unit tests for the Dedaub-style analyzer heuristics."""
 from __future__ import annotations
 
+import pytest
+
+from audit_app import analysis
 from audit_app.analysis import analyze_contract
 
 
@@ -44,3 +47,107 @@ def test_analyzer_reports_risk_vectors():
     assert report["risk_rating"]["label"] == "high"
     assert report["metrics"]["delegatecall_count"] == 1
     assert report["heuristics"]["has_owner_modifiers"] is False
+
+
+def test_solidity_08_pragma_tolerates_whitespace():
+    for pragma in ("pragma solidity ^0.8.0;", "pragma  solidity >= 0.8.19;"):
+        report = analyze_contract(address="0x01", source=f"{pragma}\ncontract A {{}}")
+        assert report["heuristics"]["uses_solidity_08_checks"] is True
+
+    report = analyze_contract(address="0x01", source="pragma solidity ^0.7.6;\ncontract A {}")
+    assert report["heuristics"]["uses_solidity_08_checks"] is False
+
+
+def test_timestamp_detector_ignores_words_containing_now():
+    source = """
+    pragma solidity ^0.8.0;
+
+    contract Registry {
+        mapping(address => bool) public known;
+
+        function isKnown(address account) external view returns (bool) {
+            return known[account];
+        }
+    }
+    """
+    report = analyze_contract(address="0x01", source=source)
+
+    assert report["metrics"]["timestamp_dependency"] == 0
+    assert "timestamp_dependence" not in {finding["id"] for finding in report["findings"]}
+
+
+def test_low_level_calls_on_one_line_are_counted_separately():
+    source = (
+        "contract Batch { function f() external { "
+        "a.call(abi.encode(1), value); b.call(abi.encode(2), value); } }"
+    )
+    report = analyze_contract(address="0x01", source=source)
+
+    # Each `.call(` followed later on the line by `value` is its own hit.
+    assert report["metrics"]["low_level_call_with_value"] == 2
+    assert report["risk_rating"] == {"label": "low", "score": 29}
+
+
+def test_analyzer_handles_empty_source():
+    report = analyze_contract(address="0x01", source="")
+
+    assert report["findings"] == []
+    assert report["metrics"]["function_count"] == 0
+    assert report["risk_rating"] == {"label": "low", "score": 5}
+
+
+DANGEROUS_SOURCE = """
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+contract Dangerous {
+    address public owner;
+    constructor() {
+        owner = msg.sender;
+    }
+
+    function rug(address target) external {
+        target.delegatecall("");
+    }
+
+    function unsafe(address payable victim) external {
+        victim.call{value: address(this).balance}("");
+    }
+
+    function nuke(address payable receiver) external {
+        selfdestruct(receiver);
+    }
+
+    function timestampGame() external view returns (uint256) {
+        return block.timestamp;
+    }
+}
+"""
+
+ACCESS_CONTROL_SOURCE = """
+pragma solidity >=0.8.0;
+
+contract Guarded is Ownable, Pausable, ReentrancyGuard {
+    function withdraw() external onlyOwner whenNotPaused nonReentrant {
+        require(tx.origin == owner());
+        payable(msg.sender).call{value: address(this).balance}("");
+    }
+
+    function grant(address account) external onlyRole(ADMIN) whenPaused {
+        suicide(payable(account));
+    }
+}
+"""
+
+
+def test_literal_counting_paths_agree(monkeypatch):
+    pytest.importorskip("ahocorasick")
+    sources = (DANGEROUS_SOURCE, ACCESS_CONTROL_SOURCE)
+    automaton_reports = [analyze_contract(address="0x01", source=source) for source in sources]
+
+    monkeypatch.setattr(analysis, "_AUTOMATON", None)
+    fallback_reports = [analyze_contract(address="0x01", source=source) for source in sources]
+
+    assert automaton_reports == fallback_reports
+    assert automaton_reports[1]["heuristics"]["has_owner_modifiers"] is True
+    assert automaton_reports[1]["metrics"]["tx_origin_references"] == 1
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from io import BytesIO
 from typing import Dict, Iterable, List, Tuple
 from wsgiref.util import setup_testing_defaults
 
-from audit_app.app import create_app
+import audit_app.app as app_module
+from audit_app.app import MAX_SOURCE_BYTES, app
 
 
 def call_app(
@@ -15,7 +17,6 @@ def call_app(
     body: str | bytes | None = None,
     headers: Dict[str, str] | None = None,
 ) -> Tuple[str, Dict[str, str], bytes]:
-    app = create_app()
     environ: Dict[str, object] = {}
     setup_testing_defaults(environ)
     environ["PATH_INFO"] = path
@@ -61,6 +62,19 @@ def test_index_route_renders():
     assert b"Dedaub-Style Smart Contract Analyzer" in body
 
 
+def test_index_route_rerenders_template_in_dev_mode(monkeypatch, tmp_path):
+    template = tmp_path / "index.html"
+    template.write_text("<h1>Live template</h1>{{CARDS}}", encoding="utf-8")
+    monkeypatch.setattr(app_module, "TEMPLATE_PATH", template)
+
+    _, _, cached = call_app("/")
+    assert b"Live template" not in cached
+
+    monkeypatch.setattr(app_module, "DEV_MODE", True)
+    _, _, live = call_app("/")
+    assert b"Live template" in live
+
+
 def test_analyze_endpoint_accepts_post_payload():
     payload = {
         "address": "0xabc123",
@@ -104,3 +118,83 @@ def test_analyze_endpoint_requires_fields():
     )
     assert status == "400 Bad Request"
     assert b"source" in body
+
+
+def test_analyze_endpoint_rejects_oversized_body():
+    status, _, body = call_app(
+        "/api/analyze",
+        method="POST",
+        body=b" " * (MAX_SOURCE_BYTES + 1),
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == "413 Payload Too Large"
+    assert str(MAX_SOURCE_BYTES).encode("utf-8") in body
+
+
+def _count_analyze_calls(monkeypatch) -> List[str]:
+    calls: List[str] = []
+    real_analyze = app_module.analyze_contract
+
+    def counting_analyze(address, source, metadata=None):
+        calls.append(address)
+        return real_analyze(address=address, source=source, metadata=metadata)
+
+    monkeypatch.setattr(app_module, "analyze_contract", counting_analyze)
+    monkeypatch.setattr(app_module, "_REPORT_CACHE", OrderedDict())
+    return calls
+
+
+def test_analyze_endpoint_caches_reports_per_input(monkeypatch):
+    calls = _count_analyze_calls(monkeypatch)
+    payload = {
+        "address": "0xcafe",
+        "source": "contract Cached { function f() external { selfdestruct(payable(msg.sender)); } }",
+        "metadata": {"compiler": "0.8.20"},
+    }
+    _, _, first = call_app("/api/analyze", method="POST", body=json.dumps(payload))
+    _, _, second = call_app("/api/analyze", method="POST", body=json.dumps(payload))
+    assert first == second
+    assert len(calls) == 1
+
+    payload["metadata"] = {"compiler": "0.8.21"}
+    _, _, third = call_app("/api/analyze", method="POST", body=json.dumps(payload))
+    assert json.loads(third)["metadata"] == {"compiler": "0.8.21"}
+    assert len(calls) == 2
+
+    payload["address"] = "0xbeef"
+    call_app("/api/analyze", method="POST", body=json.dumps(payload))
+    assert len(calls) == 3
+
+
+def test_analyze_report_cache_evicts_least_recently_used(monkeypatch):
+    calls = _count_analyze_calls(monkeypatch)
+    monkeypatch.setattr(app_module, "REPORT_CACHE_SIZE", 2)
+
+    def analyze(address: str) -> None:
+        payload = {"address": address, "source": "contract A {}"}
+        status, _, _ = call_app("/api/analyze", method="POST", body=json.dumps(payload))
+        assert status == "200 OK"
+
+    analyze("0x01")
+    analyze("0x02")
+    analyze("0x01")  # hit: 0x01 becomes the most recently used entry
+    analyze("0x03")  # evicts 0x02
+    assert calls == ["0x01", "0x02", "0x03"]
+    assert len(app_module._REPORT_CACHE) == 2
+    assert app_module._report_key("0x02", "contract A {}", {}) not in app_module._REPORT_CACHE
+
+    analyze("0x01")
+    assert calls == ["0x01", "0x02", "0x03"]
+    analyze("0x02")
+    assert calls == ["0x01", "0x02", "0x03", "0x02"]
+
+
+def test_analyze_endpoint_rejects_undecodable_body():
+    status, _, body = call_app(
+        "/api/analyze",
+        method="POST",
+        body=b'{"address": "\xff"}',
+        headers={"Content-Type": "application/json"},
+    )
+    assert status == "400 Bad Request"
+    assert b"Invalid JSON payload" in body
@@ -0,0 +1,108 @@
+"""Tests for the GF(256) arithmetic and BIP39 helpers in recover_seed."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import recover_seed
+
+WORDLIST_PATH = Path(__file__).resolve().parents[1] / "english.txt"
+WORD_LIST, WORD_INDEX = recover_seed.load_wordlist(WORDLIST_PATH)
+
+SHARE1 = bytes.fromhex("c4d26a2f8e9b01735ae8c3d9047f61b2")
+SHARE2 = bytes.fromhex("2b90e4175c03a8fd6e7210c59a3bd846")
+
+
+def _reference_mul(a: int, b: int) -> int:
+    """Shift-and-add multiply modulo the AES polynomial 0x11b."""
+    p = 0
+    for _ in range(8):
+        if b & 1:
+            p ^= a
+        carry = a & 0x80
+        a = (a << 1) & 0xff
+        if carry:
+            a ^= 0x1b
+        b >>= 1
+    return p
+
+
+def test_gf256_mul_matches_reference_for_all_byte_pairs():
+    for a in range(256):
+        for b in range(256):
+            assert recover_seed._gf256_mul(a, b) == _reference_mul(a, b)
+
+
+def test_gf256_inverse_is_multiplicative_inverse():
+    assert recover_seed._gf256_inverse(0) == 0
+    for a in range(1, 256):
+        assert recover_seed._gf256_mul(a, recover_seed._gf256_inverse(a)) == 1
+
+
+@pytest.mark.parametrize(
+    ("entropy_hex", "mnemonic"),
+    [
+        ("00000000000000000000000000000000", "abandon " * 11 + "about"),
+        (
+            "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+            "legal winner thank year wave sausage worth useful legal winner thank yellow",
+        ),
+        ("ffffffffffffffffffffffffffffffff", "zoo " * 11 + "wrong"),
+    ],
+)
+def test_bip39_round_trip_matches_reference_vectors(entropy_hex, mnemonic):
+    entropy = bytes.fromhex(entropy_hex)
+    assert recover_seed.bytes_to_mnemonic(entropy, WORD_LIST) == mnemonic
+    assert recover_seed.mnemonic_to_bytes(mnemonic, WORD_INDEX) == entropy
+
+
+def test_mnemonic_to_bytes_rejects_unknown_words():
+    with pytest.raises(ValueError, match="notaword"):
+        recover_seed.mnemonic_to_bytes("abandon " * 11 + "notaword", WORD_INDEX)
+
+
+
+def test_wordlist_index_cannot_go_stale(tmp_path):
+    word_list, word_index = recover_seed.load_wordlist(WORDLIST_PATH)
+    with pytest.raises(TypeError):
+        word_list[0], word_list[1] = word_list[1], word_list[0]
+    assert all(word_list[idx] == word for word, idx in word_index.items())
+
+    swapped = tmp_path / "swapped.txt"
+    swapped.write_text("\n".join((WORD_LIST[1], WORD_LIST[0]) + WORD_LIST[2:]), encoding="utf-8")
+    _, swapped_index = recover_seed.load_wordlist(swapped)
+    assert swapped_index["abandon"] == 1
+    assert WORD_INDEX["abandon"] == 0
+
+
+def test_recover_secret_interpolates_shares():
+    secret = recover_seed.recover_secret(SHARE1, SHARE2)
+    inv_3 = recover_seed._gf256_inverse(3)
+    for a_i, y1, y2 in zip(secret, SHARE1, SHARE2):
+        b_i = recover_seed._gf256_mul(y1 ^ y2, inv_3)
+        assert a_i ^ b_i == y1  # f(1) = a + b
+        assert a_i ^ recover_seed._gf256_mul(2, b_i) == y2  # f(2) = a + 2b
+
+
+def test_recover_secret_numpy_and_fallback_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    vectorized = recover_seed.recover_secret(SHARE1, SHARE2)
+    with pytest.raises(ValueError, match="same length"):
+        recover_seed.recover_secret(SHARE1, SHARE2 + b"\x00")
+
+    monkeypatch.setattr(recover_seed, "np", None)
+    assert recover_seed.recover_secret(SHARE1, SHARE2) == vectorized
+    for share1, share2 in ((SHARE1, SHARE2 + b"\x00"), (SHARE1 + b"\x00", SHARE2)):
+        with pytest.raises(ValueError, match="same length"):
+            recover_seed.recover_secret(share1, share2)
+
+
+@pytest.mark.parametrize("length", [0, 1, 16, 33])
+def test_recover_secret_fallback_handles_any_length(monkeypatch, length):
+    monkeypatch.setattr(recover_seed, "np", None)
+    share1 = bytes((7 * i + 3) & 0xff for i in range(length))
+    share2 = bytes(share1[i] if i % 3 == 0 else (11 * i + 5) & 0xff for i in range(length))
+    inv_3 = recover_seed._gf256_inverse(3)
+    expected = bytes(y1 ^ _reference_mul(y1 ^ y2, inv_3) for y1, y2 in zip(share1, share2))
+    assert recover_seed.recover_secret(share1, share2) == expected